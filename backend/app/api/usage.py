@@ -7,8 +7,8 @@ GET /usage - Returns all usage data for the current billing period.
 import logging
 
 from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
 
-from app.clients.orbital_api import OrbitalAPIClient
 from app.models.schemas import UsageResponse
 from app.services.usage_service import get_usage_data
 
@@ -19,27 +19,28 @@ usage_router = APIRouter(tags=["usage"])
 
 @usage_router.get(
     "/usage",
+    # Documents the contract only: the handler returns a pre-serialized
+    # response, so FastAPI does not re-validate through this model.
     response_model=UsageResponse,
-    response_model_exclude_none=True,  # CRITICAL: Omit report_name when None
+    response_class=ORJSONResponse,
     summary="Get usage data for current billing period",
     description="Returns all messages with calculated credits for the current billing period.",
 )
-async def get_usage(request: Request) -> UsageResponse:
+async def get_usage(request: Request) -> ORJSONResponse:
     """
     Get all usage data for the current billing period.
 
     Returns:
-        UsageResponse with list of usage items.
+        JSON response matching UsageResponse with list of usage items.
         Each item contains message_id, timestamp, credits_used,
         and optionally report_name if the message was a report.
     """
 
-    # Get the shared HTTP client and cache from app state
-    api_client = OrbitalAPIClient(
-        request.app.state.http_client,
-        request.app.state.report_cache,
-    )
+    # Get the shared API client from app state
+    api_client = request.app.state.orbital_client
 
     usage_items = await get_usage_data(api_client)
 
-    return UsageResponse(usage=usage_items)
+    # Items are already plain dicts without report_name for non-report
+    # messages, so they are serialized directly without a Pydantic pass
+    return ORJSONResponse(content={"usage": usage_items})
@@ -4,16 +4,24 @@ HTTP client for Orbital Witness external APIs.
 Implements:
 - GET /messages/current-period
 - GET /reports/:id
-- In-memory caching for reports
-- Concurrent batch fetching
+- In-memory caching for reports with ETag revalidation
+- Single-flight deduplication of concurrent report fetches
+- Concurrent batch fetching with bounded concurrency
 """
 
 import asyncio
 import logging
+import time
+from collections.abc import Iterable, MutableMapping
 
 import httpx
+import orjson
 
-from app.utils.constants import ORBITAL_API_BASE_URL
+from app.utils.constants import (
+    MAX_CONCURRENT_REPORT_FETCHES,
+    ORBITAL_API_BASE_URL,
+    REPORT_CACHE_TTL_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +36,22 @@ class OrbitalAPIClient:
         reports = await client.get_reports_batch([1, 2, 3])
     """
 
-    def __init__(self, client: httpx.AsyncClient, cache: dict | None = None):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        cache: MutableMapping[int, dict] | None = None,
+        max_concurrent_reports: int = MAX_CONCURRENT_REPORT_FETCHES,
+        report_ttl: float = REPORT_CACHE_TTL_SECONDS,
+    ):
         self._client = client
+        # report_id -> {"etag", "body", "expires_at"}; expired entries are
+        # kept so their ETag can be revalidated with a conditional GET
         self._report_cache = cache if cache is not None else {}
+        self._report_ttl = report_ttl
+        # Caps simultaneous report requests; cache hits never take a permit
+        self._report_semaphore = asyncio.Semaphore(max_concurrent_reports)
+        # Pending fetches keyed by report_id, shared by concurrent callers
+        self._inflight: dict[int, asyncio.Future[dict]] = {}
 
     async def get_messages(self) -> list[dict]:
         """Fetch all messages for the current billing period."""
@@ -38,50 +59,108 @@ class OrbitalAPIClient:
             f"{ORBITAL_API_BASE_URL}/messages/current-period"
         )
         response.raise_for_status()
-        data = response.json()
+        # Decode the raw body bytes directly, skipping httpx's text decoding
+        data = orjson.loads(response.content)
         return data.get("messages", [])
 
+    @staticmethod
+    def _is_fresh(entry: dict | None) -> bool:
+        """Check whether a cache entry exists and has not yet expired."""
+        return entry is not None and entry["expires_at"] > time.monotonic()
+
     async def get_report(self, report_id: int) -> dict:
         """
         Fetch a single report by ID.
 
-        Results are cached for future requests.
+        Results are cached for report_ttl seconds. Once expired, the report
+        is revalidated with If-None-Match and only re-downloaded if it has
+        changed. Concurrent calls for the same report share a single
+        upstream request, which keeps running if any one caller is cancelled.
         """
         # Check cache first
-        if report_id in self._report_cache:
+        entry = self._report_cache.get(report_id)
+        if self._is_fresh(entry):
             logger.debug(f"Report {report_id} found in cache")
-            return self._report_cache[report_id]
-
-        response = await self._client.get(f"{ORBITAL_API_BASE_URL}/reports/{report_id}")
-        response.raise_for_status()
-        report = response.json()
+            return entry["body"]
+
+        # Join a fetch that is already in flight for this report
+        if (pending := self._inflight.get(report_id)) is not None:
+            logger.debug(f"Report {report_id} fetch already in flight")
+        else:
+            pending = asyncio.ensure_future(self._fetch_report(report_id, entry))
+            self._inflight[report_id] = pending
+            pending.add_done_callback(
+                lambda task: self._finish_fetch(report_id, task)
+            )
+
+        # Shield the shared fetch so cancelling one caller doesn't abort it
+        return await asyncio.shield(pending)
+
+    def _finish_fetch(self, report_id: int, task: asyncio.Future) -> None:
+        """Clear a completed fetch from the in-flight table."""
+        del self._inflight[report_id]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_report(self, report_id: int, entry: dict | None) -> dict:
+        """Request a report upstream, revalidating a stale entry if present."""
+        headers = {}
+        if entry is not None and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+
+        async with self._report_semaphore:
+            response = await self._client.get(
+                f"{ORBITAL_API_BASE_URL}/reports/{report_id}", headers=headers
+            )
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            report, etag = entry["body"], entry["etag"]
+            logger.debug(f"Report {report_id} not modified")
+        else:
+            response.raise_for_status()
+            report = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
 
         # Cache for future requests
-        self._report_cache[report_id] = report
+        self._report_cache[report_id] = {
+            "etag": etag,
+            "body": report,
+            "expires_at": time.monotonic() + self._report_ttl,
+        }
         logger.debug(f"Report {report_id} cached")
         return report
 
-    async def get_reports_batch(self, report_ids: list[int]) -> dict[int, dict]:
+    async def get_reports_batch(self, report_ids: Iterable[int]) -> dict[int, dict]:
         """
         Fetch multiple reports concurrently with deduplication.
 
         Returns a dict mapping report_id -> report data.
+        Reports that fail to fetch are omitted.
         """
-        # Deduplicate IDs
-        unique_ids = list(set(report_ids))
-
-        # Filter out already-cached reports
-        to_fetch = [rid for rid in unique_ids if rid not in self._report_cache]
-
-        # Fetch uncached reports concurrently
+        # Deduplicate IDs, preserving request order
+        unique_ids = dict.fromkeys(report_ids)
+
+        # Serve fresh cache hits directly; only misses need a task
+        reports = {}
+        to_fetch = []
+        for rid in unique_ids:
+            entry = self._report_cache.get(rid)
+            if self._is_fresh(entry):
+                reports[rid] = entry["body"]
+            else:
+                to_fetch.append(rid)
+
+        # Fetch uncached reports concurrently (in-flight fetches are shared)
         if to_fetch:
             logger.info(f"Fetching {len(to_fetch)} uncached reports")
-            tasks = [self.get_report(rid) for rid in to_fetch]
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Return all requested reports from cache
-        return {
-            rid: self._report_cache[rid]
-            for rid in unique_ids
-            if rid in self._report_cache
-        }
+            results = await asyncio.gather(
+                *(self.get_report(rid) for rid in to_fetch), return_exceptions=True
+            )
+            for rid, report in zip(to_fetch, results, strict=True):
+                if isinstance(report, BaseException):
+                    logger.warning(f"Failed to fetch report {rid}: {report}")
+                else:
+                    reports[rid] = report
+
+        return reports
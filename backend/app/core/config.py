@@ -5,21 +5,41 @@ Loads configuration from TOML files based on environment,
 allows environment variable overrides, and configures logging.
 """
 
+import hashlib
+import json
 import logging
 import os
 import sys
+import threading
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import tomli
-
 from app.utils.constants import ConfigFile
 
+# Logging is process-wide; repeated Config() instances must not re-add handlers
+_logging_configured = False
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert tables to read-only mappings and arrays to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class Config:
     """
     Configuration manager that loads settings from TOML files
     and allows environment variable overrides.
+
+    Configuration is read-only once loaded: tables are frozen into
+    read-only mappings, and dot-notation keys are flattened up front so
+    lookups are a single dict access.
     """
 
     def __init__(self, config_file: str | None = None):
@@ -40,8 +60,10 @@ class Config:
             config_file = config_map.get(env, ConfigFile.DEVELOPMENT)
 
         self.config_file = config_file
-        self.config: dict[str, Any] = {}
+        self.config: Mapping[str, Any] = {}
+        self._flat: dict[str, Any] = {}
         self._load_config()
+        self._flatten(self.config)
         self._configure_logging()
 
     def _load_config(self) -> None:
@@ -54,14 +76,74 @@ class Config:
                 f"Config file: {self.config_file}"
             )
 
+        self.config = self._read_toml(config_path)
+
+        # Apply environment variable overrides
+        self._apply_env_overrides()
+
+        # Freeze so callers can't diverge from the flattened index
+        self.config = _freeze(self.config)
+
+    @staticmethod
+    def _cache_path(config_path: Path) -> Path:
+        """Locate the parsed-config cache for a TOML file in the user cache dir."""
+        cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        digest = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()
+        cache_name = f"{config_path.stem}-{digest[:16]}.json"
+        return Path(cache_home) / "orbital-usage-api" / cache_name
+
+    @staticmethod
+    def _read_toml(config_path: Path) -> dict[str, Any]:
+        """
+        Parse a TOML file, reusing the parsed JSON from a previous start.
+
+        The parsed dict is cached under the per-user cache directory, keyed
+        by the file's path, mtime and size, so warm starts skip both the
+        tomli import and the parse. Environment overrides are not cached;
+        they are applied afterwards.
+        """
+        try:
+            stat = config_path.stat()
+            cache_key = [str(config_path.resolve()), stat.st_mtime_ns, stat.st_size]
+            cache_path = Config._cache_path(config_path)
+        except (OSError, RuntimeError):
+            # No usable cache location (e.g. no home directory for this uid)
+            cache_path = None
+
+        if cache_path is not None:
+            try:
+                cached = json.loads(cache_path.read_bytes())
+                if isinstance(cached, dict) and cached.get("key") == cache_key:
+                    return cached["config"]
+            except (OSError, ValueError, KeyError):
+                # Missing, unreadable or corrupt cache: fall back to parsing
+                pass
+
+        import tomli
+
         try:
             with open(config_path, "rb") as f:
-                self.config = tomli.load(f)
+                config = tomli.load(f)
         except tomli.TOMLDecodeError as e:
             raise ValueError(f"Invalid TOML in {config_path}: {e}") from e
 
-        # Apply environment variable overrides
-        self._apply_env_overrides()
+        if cache_path is None:
+            return config
+
+        # Write atomically; TOML dates (not JSON-serializable) or an
+        # unwritable cache directory just skip caching
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps({"key": cache_key, "config": config})
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, cache_path)
+        except TypeError:
+            pass
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+        return config
 
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides to configuration."""
@@ -104,7 +186,12 @@ class Config:
             self.config.setdefault("api", {})["timeout"] = int(api_timeout)
 
     def _configure_logging(self) -> None:
-        """Configure logging based on configuration settings."""
+        """Configure logging based on configuration settings (once per process)."""
+        global _logging_configured
+        if _logging_configured:
+            return
+        _logging_configured = True
+
         logging_config = self.config.get("logging", {})
         log_level = logging_config.get("level", "INFO")
         log_format = logging_config.get(
@@ -130,6 +217,19 @@ class Config:
             logger = logging.getLogger(logger_name)
             logger.setLevel(getattr(logging, logger_level.upper(), logging.INFO))
 
+    def _flatten(self, config: Mapping[str, Any], prefix: str = "") -> None:
+        """
+        Index every configuration value by its dot-notation key.
+
+        Nested tables are indexed as well as their leaves, so both
+        'db' and 'db.host' resolve.
+        """
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            self._flat[path] = value
+            if isinstance(value, Mapping):
+                self._flatten(value, prefix=f"{path}.")
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by key using dot notation.
@@ -141,18 +241,8 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -172,27 +262,27 @@ class Config:
             raise KeyError(f"Configuration key not found: {key}")
         return value
 
-    @property
+    @cached_property
     def server_host(self) -> str:
         """Get server host."""
         return self.get("server.host", "0.0.0.0")
 
-    @property
+    @cached_property
     def server_port(self) -> int:
         """Get server port."""
         return self.get("server.port", 8000)
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Get database URL."""
         return self.get("database.url", "sqlite:///./orbital.db")
 
-    @property
+    @cached_property
     def api_timeout(self) -> int:
         """Get API timeout in seconds."""
         return self.get("api.timeout", 30)
 
-    @property
+    @cached_property
     def debug(self) -> bool:
         """Check if debug mode is enabled."""
         return self.get("debug", False)
@@ -200,6 +290,7 @@ class Config:
 
 # Global configuration instance
 _config: Config | None = None
+_config_lock = threading.Lock()
 
 
 def get_config(config_file: str | None = None) -> Config:
@@ -214,7 +305,10 @@ def get_config(config_file: str | None = None) -> Config:
     """
     global _config
     if _config is None:
-        _config = Config(config_file)
+        with _config_lock:
+            # Re-check: another thread may have created it while we waited
+            if _config is None:
+                _config = Config(config_file)
     return _config
 
 
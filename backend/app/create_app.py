@@ -8,10 +8,18 @@ import logging
 from contextlib import asynccontextmanager
 
 import httpx
+from cachetools import LRUCache
 from app.api import health_router, usage_router
+from app.clients.orbital_api import OrbitalAPIClient
 from app.core.config import get_config
+from app.utils.constants import (
+    MAX_CONCURRENT_REPORT_FETCHES,
+    REPORT_CACHE_MAXSIZE,
+    REPORT_CACHE_TTL_SECONDS,
+)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -29,18 +37,48 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
 
-    Creates shared HTTP client and report cache on startup.
+    Creates shared HTTP client, report cache and Orbital API client on startup.
     Cleans up resources on shutdown.
     """
     logging.info("Application startup")
 
-    # Create a single HTTP client that will be reused across all requests
-    app.state.http_client = httpx.AsyncClient(timeout=30.0)
+    # Create a single HTTP client that will be reused across all requests.
+    # HTTP/2 lets concurrent report fetches multiplex over one connection;
+    # pool limits and http2 live on the transport: httpx ignores the client
+    # level options when an explicit transport is supplied.
+    app.state.http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=60.0,
+            ),
+            retries=2,
+        ),
+    )
+
+    config = app.state.config
 
-    # In-memory cache for reports (reports are semi-static)
-    app.state.report_cache = {}
+    # In-memory cache for reports, size-bounded with LRU eviction. Reports are
+    # semi-static: the client expires entries after a TTL and revalidates
+    # them by ETag, so expired entries stay cached until evicted.
+    app.state.report_cache = LRUCache(
+        maxsize=config.get("external_api.report_cache_maxsize", REPORT_CACHE_MAXSIZE),
+    )
+
+    # Single API client so in-flight report fetches are shared across requests
+    app.state.orbital_client = OrbitalAPIClient(
+        app.state.http_client,
+        app.state.report_cache,
+        max_concurrent_reports=config.get(
+            "external_api.max_concurrent_reports", MAX_CONCURRENT_REPORT_FETCHES
+        ),
+        report_ttl=config.get("external_api.report_cache_ttl", REPORT_CACHE_TTL_SECONDS),
+    )
 
-    logging.info("Initialized HTTP client and report cache")
+    logging.info("Initialized HTTP client, report cache and Orbital API client")
 
     try:
         yield
@@ -69,6 +107,7 @@ def get_app(config_file: str) -> FastAPI:
         ),
         version=config.get("api.version", "1.0.0"),
         debug=config.get("api.debug", False),
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -87,8 +126,10 @@ def get_app(config_file: str) -> FastAPI:
         CORSMiddleware,
         allow_origins=origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let Starlette build the CORS headers once up front
+        allow_methods=["GET", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type"],
+        max_age=86400,  # Let browsers cache preflight responses for 24h
     )
 
     return app
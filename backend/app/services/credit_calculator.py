@@ -8,34 +8,59 @@ Implements the credit calculation rules:
 - Round to 2 decimal places
 """
 
-import re
-from decimal import ROUND_HALF_UP, Decimal
+import string
+from collections.abc import Callable
+from functools import lru_cache
 
 from app.utils.constants import BASE_MODEL_RATE, CHARACTERS_PER_TOKEN, MINIMUM_CREDITS
 
+# Every ASCII byte that is not a word character (a-z, A-Z, ' and -)
+_NON_WORD_BYTES = bytes(
+    b for b in range(128) if chr(b) not in string.ascii_letters + "'-"
+)
 
-def calculate_message_credits(text: str) -> float:
+
+def _make_credits_for_length(
+    base_model_rate: int, characters_per_token: int, minimum_credits: float
+) -> Callable[[int], float]:
     """
-    Calculate credits for a text-based message (no report).
+    Build the text credit kernel with the pricing constants baked in.
 
-    Uses character-based token estimation: 1 token ≈ 4 characters.
-    Counts ALL characters including spaces and punctuation.
+    The constants are folded once and captured in the closure, so each
+    call only does the multiply, add, floor-divide and compare:
+    credits = (char_count / characters_per_token / 100) * base_model_rate,
+    computed in hundredths of a credit and rounded half-up using
+    round_half_up(a / b) == (2a + b) // 2b.
     """
+    numerator = 2 * base_model_rate
+    denominator = 2 * characters_per_token
+    minimum_cents = round(minimum_credits * 100)
+
+    @lru_cache(maxsize=4096)
+    def credits_for_length(char_count: int) -> float:
+        # Credits depend only on length, so results are memoized by length
+        cents = (char_count * numerator + characters_per_token) // denominator
+        # A plain compare is cheaper than a max() call for the minimum
+        return (cents if cents > minimum_cents else minimum_cents) / 100
+
+    return credits_for_length
 
-    # Step 1: Count characters
-    char_count = len(text)
 
-    # Step 2: Estimate tokens (1 token ≈ 4 characters)
-    estimated_tokens = char_count / CHARACTERS_PER_TOKEN
+_credits_for_length = _make_credits_for_length(
+    BASE_MODEL_RATE, CHARACTERS_PER_TOKEN, MINIMUM_CREDITS
+)
 
-    # Step 3: Calculate credits using formula
-    credits = Decimal(str((estimated_tokens / 100) * BASE_MODEL_RATE))
 
-    # Step 4: Round to 2 decimal places
-    credits = credits.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def calculate_message_credits(text: str) -> float:
+    """
+    Calculate credits for a text-based message (no report).
+
+    Uses character-based token estimation: 1 token ≈ 4 characters.
+    Counts ALL characters including spaces and punctuation.
+    """
 
-    # Step 5: Apply minimum of 1.00 credit
-    return float(max(credits, Decimal(str(MINIMUM_CREDITS))))
+    # Count characters; the rate, rounding and minimum live in the kernel
+    return _credits_for_length(len(text))
 
 
 def extract_word_characters(text: str) -> str:
@@ -45,8 +70,10 @@ def extract_word_characters(text: str) -> str:
     A "word" is defined as any continual sequence of letters, plus ' and -.
     All other characters (spaces, punctuation, numbers, etc.) are stripped.
     """
-    # Keep only letters (a-z, A-Z), apostrophes ('), and hyphens (-)
-    return re.sub(r"[^a-zA-Z'\-]", "", text)
+    # Keep only letters (a-z, A-Z), apostrophes ('), and hyphens (-).
+    # Non-ASCII characters are never word characters, so they are dropped
+    # by the encode; the remaining bytes are filtered in C by translate.
+    return text.encode("ascii", "ignore").translate(None, _NON_WORD_BYTES).decode("ascii")
 
 
 def calculate_message_credits_word_chars_only(text: str) -> float:
@@ -75,9 +102,9 @@ def get_report_credits(credit_cost: int) -> float:
     Get credits for a report-based message.
 
     Report costs are authoritative from the external API.
-    No minimum applies - format to 2 decimal places for consistency.
+    No minimum applies. Costs are whole credits, so the float is exact.
     """
-    return float(Decimal(str(credit_cost)).quantize(Decimal("0.01")))
+    return float(credit_cost)
 
 
 def get_credits_for_message(message: dict, report: dict | None) -> float:
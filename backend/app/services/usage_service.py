@@ -5,13 +5,12 @@ Usage service for aggregating and processing usage data.
 import logging
 
 from app.clients.orbital_api import OrbitalAPIClient
-from app.models.schemas import UsageItem
-from app.services.credit_calculator import get_credits_for_message
+from app.services.credit_calculator import calculate_message_credits, get_report_credits
 
 logger = logging.getLogger(__name__)
 
 
-async def get_usage_data(api_client: OrbitalAPIClient) -> list[UsageItem]:
+async def get_usage_data(api_client: OrbitalAPIClient) -> list[dict]:
     """
     Fetch and process all usage data for the current period.
 
@@ -19,34 +18,41 @@ async def get_usage_data(api_client: OrbitalAPIClient) -> list[UsageItem]:
     2. Identify which messages have reports
     3. Batch fetch all needed reports
     4. Calculate credits for each message
-    5. Return formatted usage items
+    5. Return usage items as JSON-ready dicts (UsageItem shape)
     """
 
     # Fetch all messages
     messages = await api_client.get_messages()
     logger.info(f"Fetched {len(messages)} messages")
 
-    # Identify report IDs needed
-    report_ids = [msg["report_id"] for msg in messages if msg.get("report_id")]
+    # Identify the unique report IDs needed
+    report_ids = {msg["report_id"] for msg in messages if msg.get("report_id")}
 
-    # Batch fetch all reports
+    # Batch fetch all reports. Failed reports are omitted, so those messages
+    # fall back to text-based credits.
     reports_map = await api_client.get_reports_batch(report_ids)
     logger.info(f"Fetched {len(reports_map)} unique reports")
 
-    # Process each message
+    # Resolve each message's report once, in a parallel list
+    report_for = reports_map.get
+    reports_per_message = [report_for(msg.get("report_id")) for msg in messages]
+
+    # Build the JSON-ready items with the credit functions bound to locals so
+    # the loop avoids repeated global lookups. Items follow the UsageItem
+    # contract but are plain dicts, so no Pydantic model is created per
+    # message. CRITICAL: report_name must be omitted entirely (not null) for
+    # text messages.
+    report_credits = get_report_credits
+    text_credits = calculate_message_credits
+
     usage_items = []
-    for msg in messages:
-        report_id = msg.get("report_id")
-        report = reports_map.get(report_id) if report_id else None
-
-        credits = get_credits_for_message(msg, report)
-
-        usage_item = UsageItem(
-            message_id=msg["id"],
-            timestamp=msg["timestamp"],
-            report_name=report["name"] if report else None,
-            credits_used=credits,
-        )
-        usage_items.append(usage_item)
+    for msg, report in zip(messages, reports_per_message, strict=True):
+        item = {"message_id": msg["id"], "timestamp": msg["timestamp"]}
+        if report:
+            item["report_name"] = report["name"]
+            item["credits_used"] = report_credits(report["credit_cost"])
+        else:
+            item["credits_used"] = text_credits(msg["text"])
+        usage_items.append(item)
 
     return usage_items
@@ -1,8 +1,6 @@
 """
 Pytest configuration and fixtures.
 """
-import asyncio
-
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
@@ -12,16 +10,6 @@ from app.create_app import get_app
 from app.utils.constants import ConfigFile
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """
-    Create event loop for entire test session.
-    """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="function", autouse=True)
 def reset_config_fixture():
     """Reset config between tests."""
@@ -39,10 +27,12 @@ def test_config():
     return get_config(ConfigFile.TEST)
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_app():
+@pytest.fixture(scope="session")
+def test_app():
     """
     Create FastAPI application with test configuration.
+
+    Built once per session.
     """
     app = get_app(ConfigFile.TEST)
     yield app
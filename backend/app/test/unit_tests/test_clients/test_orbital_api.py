@@ -0,0 +1,237 @@
+"""
+Tests for the Orbital API client.
+"""
+
+import asyncio
+from collections import defaultdict
+
+import httpx
+import pytest
+
+from app.clients.orbital_api import OrbitalAPIClient
+
+REPORT = {"id": 5392, "name": "Tenant Obligations Report", "credit_cost": 79}
+UPDATED_REPORT = {"id": 5392, "name": "Tenant Obligations Report", "credit_cost": 94}
+OTHER_REPORT = {"id": 8806, "name": "Short Lease Report", "credit_cost": 61}
+
+
+class UpstreamStub:
+    """
+    MockTransport handler replaying each report's queued responses in order.
+
+    Requests wait on `release`, so tests can clear it to hold fetches open
+    while concurrent callers pile up.
+    """
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.responses: dict[int, list[httpx.Response]] = defaultdict(list)
+        self.release = asyncio.Event()
+        self.release.set()
+        # Requests currently held open, and the most seen at once
+        self.open = 0
+        self.peak_open = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.open += 1
+        self.peak_open = max(self.peak_open, self.open)
+        try:
+            await self.release.wait()
+        finally:
+            self.open -= 1
+        report_id = int(request.url.path.rsplit("/", 1)[-1])
+        return self.responses[report_id].pop(0)
+
+
+@pytest.fixture
+def upstream():
+    stub = UpstreamStub()
+    stub.responses[5392].append(
+        httpx.Response(200, json=REPORT, headers={"ETag": '"v1"'})
+    )
+    stub.responses[8806].append(httpx.Response(200, json=OTHER_REPORT))
+    return stub
+
+
+@pytest.fixture
+def report_cache():
+    return {}
+
+
+@pytest.fixture
+async def api_client(upstream, report_cache):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        yield OrbitalAPIClient(client, report_cache)
+
+
+def expire(report_cache, report_id):
+    """Age a cached report past its TTL."""
+    report_cache[report_id]["expires_at"] = 0.0
+
+
+class TestGetReportSingleFlight:
+    """Tests for sharing one upstream fetch between concurrent callers."""
+
+    async def test_concurrent_callers_share_one_request(self, api_client, upstream):
+        """N concurrent callers for the same report trigger a single GET."""
+        upstream.release.clear()
+        callers = [asyncio.create_task(api_client.get_report(5392)) for _ in range(5)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        assert await asyncio.gather(*callers) == [REPORT] * 5
+        assert len(upstream.requests) == 1
+
+    async def test_failure_propagates_to_joiners(self, api_client, upstream):
+        """Every caller sharing a failed fetch sees its error."""
+        upstream.responses[5392][:] = [httpx.Response(500)]
+        upstream.release.clear()
+        callers = [asyncio.create_task(api_client.get_report(5392)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert len(upstream.requests) == 1
+
+    async def test_cancelled_joiner_does_not_abort_shared_fetch(
+        self, api_client, upstream
+    ):
+        """Cancelling one joiner leaves the fetcher and other joiners served."""
+        upstream.release.clear()
+        fetcher = asyncio.create_task(api_client.get_report(5392))
+        await asyncio.sleep(0)
+        joiners = [asyncio.create_task(api_client.get_report(5392)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        joiners[0].cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        assert await fetcher == REPORT
+        assert await joiners[1] == REPORT
+        assert joiners[0].cancelled()
+        assert len(upstream.requests) == 1
+
+
+class TestGetReportConcurrencyLimit:
+    """Tests for the cap on simultaneous upstream report requests."""
+
+    async def test_open_requests_capped(self, upstream, report_cache):
+        """At most max_concurrent_reports requests are open; cache hits skip it."""
+        report_ids = range(1, 6)
+        for rid in report_ids:
+            upstream.responses[rid].append(
+                httpx.Response(200, json={"id": rid, "name": "R", "credit_cost": 1})
+            )
+
+        transport = httpx.MockTransport(upstream)
+        async with httpx.AsyncClient(transport=transport) as client:
+            api_client = OrbitalAPIClient(
+                client, report_cache, max_concurrent_reports=2
+            )
+            await api_client.get_report(5392)
+
+            upstream.release.clear()
+            fetches = [
+                asyncio.create_task(api_client.get_report(rid)) for rid in report_ids
+            ]
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert upstream.open == 2
+
+            # Both permits are held, yet a cached report is still served
+            assert await asyncio.wait_for(api_client.get_report(5392), 1) == REPORT
+
+            upstream.release.set()
+            await asyncio.gather(*fetches)
+
+        assert upstream.peak_open == 2
+        assert len(upstream.requests) == 6
+
+
+class TestGetReportRevalidation:
+    """Tests for ETag revalidation of expired cache entries."""
+
+    async def test_fresh_entry_served_from_cache(self, api_client, upstream):
+        """A report within its TTL is not requested again."""
+        await api_client.get_report(5392)
+
+        assert await api_client.get_report(5392) == REPORT
+        assert len(upstream.requests) == 1
+
+    async def test_not_modified_reuses_body_and_resets_expiry(
+        self, api_client, upstream, report_cache
+    ):
+        """A 304 keeps the cached body and ETag and makes the entry fresh again."""
+        await api_client.get_report(5392)
+        expire(report_cache, 5392)
+        upstream.responses[5392].append(httpx.Response(304))
+
+        assert await api_client.get_report(5392) == REPORT
+        assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+        assert report_cache[5392]["etag"] == '"v1"'
+
+        # The refreshed entry is served without another request
+        await api_client.get_report(5392)
+        assert len(upstream.requests) == 2
+
+    async def test_modified_replaces_body_and_etag(
+        self, api_client, upstream, report_cache
+    ):
+        """A 200 after expiry replaces the cached body and ETag."""
+        await api_client.get_report(5392)
+        expire(report_cache, 5392)
+        upstream.responses[5392].append(
+            httpx.Response(200, json=UPDATED_REPORT, headers={"ETag": '"v2"'})
+        )
+
+        assert await api_client.get_report(5392) == UPDATED_REPORT
+        assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+        assert report_cache[5392]["body"] == UPDATED_REPORT
+        assert report_cache[5392]["etag"] == '"v2"'
+
+
+class TestGetReportsBatch:
+    """Tests for get_reports_batch function."""
+
+    async def test_duplicate_ids_fetched_once(self, api_client, upstream):
+        """Each unique report is requested once, however often it appears."""
+        reports = await api_client.get_reports_batch([5392, 8806, 5392, 8806])
+
+        assert reports == {5392: REPORT, 8806: OTHER_REPORT}
+        assert len(upstream.requests) == 2
+
+    async def test_fresh_cache_hits_issue_no_request(self, api_client, upstream):
+        """Reports still within their TTL are served without a request."""
+        await api_client.get_reports_batch([5392, 8806])
+
+        reports = await api_client.get_reports_batch([5392, 8806])
+
+        assert reports == {5392: REPORT, 8806: OTHER_REPORT}
+        assert len(upstream.requests) == 2
+
+    async def test_failed_report_is_omitted(self, api_client, upstream, caplog):
+        """A failing report is logged and left out without affecting the others."""
+        upstream.responses[8806][:] = [httpx.Response(500)]
+
+        reports = await api_client.get_reports_batch([5392, 8806])
+
+        assert reports == {5392: REPORT}
+        assert "Failed to fetch report 8806" in caplog.text
+
+    async def test_stale_entry_is_revalidated(
+        self, api_client, upstream, report_cache
+    ):
+        """An expired report is revalidated with its ETag, not re-downloaded."""
+        await api_client.get_reports_batch([5392])
+        expire(report_cache, 5392)
+        upstream.responses[5392].append(httpx.Response(304))
+
+        reports = await api_client.get_reports_batch([5392])
+
+        assert reports == {5392: REPORT}
+        assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+        assert len(upstream.requests) == 2
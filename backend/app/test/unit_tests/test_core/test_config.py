@@ -0,0 +1,136 @@
+"""
+Tests for configuration loading.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.config import Config
+from app.utils.constants import ConfigFile
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the per-user cache directory at a temporary path."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "app.toml"
+    path.write_text('[server]\nhost = "127.0.0.1"\nport = 8000\n')
+    return path
+
+
+class TestReadTomlCache:
+    """Tests for the parsed-TOML cache used by Config._read_toml."""
+
+    def test_miss_parses_and_writes_cache(self, config_path, cache_home):
+        """Without a cache the TOML is parsed and the result cached as JSON."""
+        config = Config._read_toml(config_path)
+
+        assert config == {"server": {"host": "127.0.0.1", "port": 8000}}
+        cached = json.loads(Config._cache_path(config_path).read_text())
+        assert cached["config"] == config
+        assert Config._cache_path(config_path).is_relative_to(cache_home)
+
+    def test_hit_returns_cached_config(self, config_path):
+        """A cache matching the file's path, mtime and size is used as-is."""
+        Config._read_toml(config_path)
+        cache_path = Config._cache_path(config_path)
+        cached = json.loads(cache_path.read_text())
+        cached["config"]["server"]["host"] = "from-cache"
+        cache_path.write_text(json.dumps(cached))
+
+        assert Config._read_toml(config_path)["server"]["host"] == "from-cache"
+
+    def test_stale_cache_is_reparsed(self, config_path):
+        """Editing the TOML invalidates the cache."""
+        Config._read_toml(config_path)
+        config_path.write_text('[server]\nhost = "0.0.0.0"\nport = 9000\n')
+        # Guarantee a new mtime even on coarse-grained filesystems
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        config = Config._read_toml(config_path)
+
+        assert config == {"server": {"host": "0.0.0.0", "port": 9000}}
+        cached = json.loads(Config._cache_path(config_path).read_text())
+        assert cached["config"] == config
+
+    @pytest.mark.parametrize(
+        "contents",
+        [b"\x80\x04not json", b'{"key": ', b"[1, 2, 3]"],
+        ids=["binary_garbage", "truncated_json", "wrong_shape"],
+    )
+    def test_corrupt_cache_is_reparsed(self, config_path, contents):
+        """An unreadable cache falls back to parsing and is rewritten."""
+        cache_path = Config._cache_path(config_path)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(contents)
+
+        config = Config._read_toml(config_path)
+
+        assert config == {"server": {"host": "127.0.0.1", "port": 8000}}
+        assert json.loads(cache_path.read_text())["config"] == config
+
+    def test_cache_without_config_is_reparsed(self, config_path):
+        """A cache whose key matches but has no config falls back to parsing."""
+        Config._read_toml(config_path)
+        cache_path = Config._cache_path(config_path)
+        cached = json.loads(cache_path.read_text())
+        cache_path.write_text(json.dumps({"key": cached["key"]}))
+
+        assert Config._read_toml(config_path) == cached["config"]
+
+    def test_no_home_directory_parses_without_caching(
+        self, config_path, cache_home, monkeypatch
+    ):
+        """Without any cache location the TOML is still parsed."""
+        monkeypatch.delenv("XDG_CACHE_HOME")
+
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(Path, "home", staticmethod(no_home))
+
+        config = Config._read_toml(config_path)
+
+        assert config == {"server": {"host": "127.0.0.1", "port": 8000}}
+        assert not cache_home.exists()
+
+    def test_unserializable_config_is_not_cached(self, config_path):
+        """TOML dates have no JSON form, so such files are parsed every time."""
+        config_path.write_text("released = 2024-01-01\n")
+
+        assert str(Config._read_toml(config_path)["released"]) == "2024-01-01"
+        assert not Config._cache_path(config_path).exists()
+
+
+class TestConfigReadOnly:
+    """Tests that loaded configuration cannot be modified."""
+
+    def test_top_level_is_read_only(self):
+        config = Config(ConfigFile.TEST)
+
+        with pytest.raises(TypeError):
+            config.config["debug"] = True
+
+    def test_nested_tables_are_read_only(self):
+        config = Config(ConfigFile.TEST)
+
+        with pytest.raises(TypeError):
+            config.config["api"]["timeout"] = 1
+
+    def test_env_overrides_survive_freezing(self, monkeypatch):
+        monkeypatch.setenv("SERVER_PORT", "9001")
+
+        config = Config(ConfigFile.TEST)
+
+        assert config.config["server"]["port"] == 9001
+        assert config.get("server.port") == 9001
@@ -0,0 +1,81 @@
+"""
+Tests for usage service.
+"""
+
+import httpx
+import pytest
+
+from app.clients.orbital_api import OrbitalAPIClient
+from app.models.schemas import UsageResponse
+from app.services.usage_service import get_usage_data
+
+REPORTS = {
+    5392: {"id": 5392, "name": "Tenant Obligations Report", "credit_cost": 79},
+}
+
+REPORT_MESSAGE = {
+    "id": 1000,
+    "timestamp": "2024-04-29T02:08:29.375Z",
+    "text": "Generate a Tenant Obligations Report for the new lease terms.",
+    "report_id": 5392,
+}
+TEXT_MESSAGE = {
+    "id": 1001,
+    "timestamp": "2024-04-29T03:25:03.613Z",
+    "text": "a" * 400,
+}
+FAILED_REPORT_MESSAGE = {
+    "id": 1002,
+    "timestamp": "2024-04-29T07:27:34.985Z",
+    "text": "a" * 156,
+    "report_id": 8806,
+}
+
+
+def upstream(request: httpx.Request) -> httpx.Response:
+    """Serve the message list and known reports; unknown reports fail."""
+    path = request.url.path
+    if path.endswith("/messages/current-period"):
+        return httpx.Response(
+            200, json={"messages": [REPORT_MESSAGE, TEXT_MESSAGE, FAILED_REPORT_MESSAGE]}
+        )
+    report = REPORTS.get(int(path.rsplit("/", 1)[-1]))
+    return httpx.Response(200, json=report) if report else httpx.Response(500)
+
+
+@pytest.fixture
+async def usage_items():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        yield await get_usage_data(OrbitalAPIClient(client))
+
+
+class TestGetUsageData:
+    """Tests for get_usage_data function."""
+
+    async def test_report_message_uses_report_name_and_cost(self, usage_items):
+        assert usage_items[0] == {
+            "message_id": 1000,
+            "timestamp": "2024-04-29T02:08:29.375Z",
+            "report_name": "Tenant Obligations Report",
+            "credits_used": 79.0,
+        }
+
+    async def test_text_message_omits_report_name(self, usage_items):
+        """report_name must be absent, not null, for text messages."""
+        assert usage_items[1] == {
+            "message_id": 1001,
+            "timestamp": "2024-04-29T03:25:03.613Z",
+            "credits_used": 40.0,
+        }
+        assert "report_name" not in usage_items[1]
+
+    async def test_failed_report_falls_back_to_text_credits(self, usage_items):
+        assert usage_items[2] == {
+            "message_id": 1002,
+            "timestamp": "2024-04-29T07:27:34.985Z",
+            "credits_used": 15.6,
+        }
+
+    async def test_items_match_usage_response_contract(self, usage_items):
+        """Every item validates against the documented response model."""
+        UsageResponse.model_validate({"usage": usage_items})
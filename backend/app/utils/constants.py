@@ -17,3 +17,6 @@ CHARACTERS_PER_TOKEN = 4
 
 # External API
 ORBITAL_API_BASE_URL = "https://owpublic.blob.core.windows.net/tech-task"
+MAX_CONCURRENT_REPORT_FETCHES = 32
+REPORT_CACHE_MAXSIZE = 10_000
+REPORT_CACHE_TTL_SECONDS = 3600